@@ -71,6 +71,7 @@ class CoxFamily(object):
     event_id: Optional[str] = 'event'
     status_id: Optional[str] = 'status'
     start_id: Optional[str] = None
+    strata_id: Optional[str] = None
 
 @dataclass
 class CoxFamilySpec(object):
@@ -80,6 +81,7 @@ class CoxFamilySpec(object):
     event_id: Optional[str] = 'event'
     status_id: Optional[str] = 'status'
     start_id: Optional[str] = None
+    strata_id: Optional[str] = None
     name: str = 'Cox'
     
     def __hash__(self):
@@ -88,6 +90,7 @@ class CoxFamilySpec(object):
                 self.event_id,
                 self.status_id,
                 self.start_id,
+                self.strata_id,
                 self.name).__hash__()
 
     def __post_init__(self, event_data):
@@ -96,17 +99,31 @@ class CoxFamilySpec(object):
             self.status_id not in event_data.columns):
             raise ValueError(f'expecting f{event_id} and f{status_id} columns')
         
-        event = event_data[self.event_id]
-        status = event_data[self.status_id]
-        
+        # hand raw contiguous arrays to CoxDeviance rather
+        # than pandas Series
+
+        event = np.ascontiguousarray(event_data[self.event_id], float)
+        status = np.ascontiguousarray(event_data[self.status_id])
+
         if self.start_id is not None:
-            start = event_data[self.start_id]
+            start = np.ascontiguousarray(event_data[self.start_id], float)
         else:
             start = None
 
+        # coxdev computes risk sets separately within
+        # each stratum -- it expects integer labels
+
+        if self.strata_id is not None:
+            strata = pd.factorize(event_data[self.strata_id])[0]
+            if np.any(strata < 0):
+                raise ValueError(f'missing values in strata column {self.strata_id}')
+        else:
+            strata = None
+
         self._coxdev = CoxDeviance(event,
                                    status,
                                    start=start,
+                                   strata=strata,
                                    tie_breaking=self.tie_breaking)
 
     # GLMFamilySpec API
@@ -188,7 +205,8 @@ class CoxLM(GLM):
                              tie_breaking=self.family.tie_breaking,
                              event_id=self.family.event_id,
                              status_id=self.family.status_id,
-                             start_id=self.family.start_id)
+                             start_id=self.family.start_id,
+                             strata_id=self.family.strata_id)
 
     def _check(self,
                X,
@@ -260,7 +278,8 @@ class RegCoxLM(RegGLM):
                              tie_breaking=self.family.tie_breaking,
                              event_id=self.family.event_id,
                              status_id=self.family.status_id,
-                             start_id=self.family.start_id)
+                             start_id=self.family.start_id,
+                             strata_id=self.family.strata_id)
 
 @dataclass
 class CoxNet(GLMNet):
@@ -288,7 +307,8 @@ class CoxNet(GLMNet):
                              tie_breaking=self.family.tie_breaking,
                              event_id=self.family.event_id,
                              status_id=self.family.status_id,
-                             start_id=self.family.start_id)
+                             start_id=self.family.start_id,
+                             strata_id=self.family.strata_id)
     
     def _get_initial_state(self,
                            X,
@@ -361,6 +381,7 @@ class CoxScorer(Scorer):
                         event_id=coxfam.event_id,
                         status_id=coxfam.status_id,
                         start_id=coxfam.start_id,
+                        strata_id=coxfam.strata_id,
                         event_data=event_split)
 
         split_w = sample_weight[split]
@@ -389,6 +410,7 @@ class CoxDiffScorer(CoxScorer):
                        event_id=coxfam.event_id,
                        status_id=coxfam.status_id,
                        start_id=coxfam.start_id,
+                       strata_id=coxfam.strata_id,
                        event_data=event_data)
         dev_full = fam_full._coxdev(predictions, sample_weight).deviance
 
@@ -402,6 +424,7 @@ class CoxDiffScorer(CoxScorer):
                           event_id=coxfam.event_id,
                           status_id=coxfam.status_id,
                           start_id=coxfam.start_id,
+                          strata_id=coxfam.strata_id,
                           event_data=event_c)
         split_c_w = sample_weight[split_c]
         dev_c = fam_split_c._coxdev(predictions[split_c], split_c_w).deviance
@@ -172,10 +172,13 @@ class FastNetMixin(GLMNet): # base class for C++ path methods
 
         if ninmax > 0:
             if _fit['ca'].ndim == 1: # logistic is like this
-                unsort_coefs = _fit['ca'][:(nvars*nfits)].reshape(nfits, nvars)
+                # C++ stores each fit in a block of length nx --
+                # a zero-copy view of the flat array
+                nx = _args['nx']
+                unsort_coefs = _fit['ca'][:(nx*nfits)].reshape(nfits, nx)
             else:
                 unsort_coefs = _fit['ca'][:,:nfits].T
-            df = (np.fabs(unsort_coefs) > 0).sum(1)
+            df = (unsort_coefs != 0).sum(1)
 
             # this is order variables appear in the path
             # reorder to set original coords
@@ -227,11 +230,8 @@ class FastNetMixin(GLMNet): # base class for C++ path methods
         # compute jd
         # assume that there are no constant variables
 
-        if len(exclude) > 0:
-            jd = np.hstack([len(exclude), exclude]).astype(np.int32)
-        else:
-            jd = np.array([0], np.int32)
-            
+        jd = np.array([len(exclude)] + list(exclude), np.int32)
+
         # compute cl from upper and lower limits
 
         if not np.all(self.lower_limits <= 0):
@@ -240,8 +240,8 @@ class FastNetMixin(GLMNet): # base class for C++ path methods
         if not np.all(self.upper_limits >= 0):
             raise ValueError('upper limits should be >= 0')
 
-        cl = np.asarray([self.lower_limits,
-                         self.upper_limits], float)
+        cl = np.array([self.lower_limits,
+                       self.upper_limits], float, order='F')
 
         if np.any(cl[0] == 0) or np.any(cl[-1] == 0):
             self.control.fdev = 0
@@ -259,7 +259,7 @@ class FastNetMixin(GLMNet): # base class for C++ path methods
                  'w':sample_weight.reshape((-1,1)),
                  'jd':jd,
                  'vp':self.penalty_factor.reshape((-1,1)),
-                 'cl':np.asfortranarray(cl),
+                 'cl':cl,
                  'ne':self.df_max,
                  'nx':nx,
                  'nlam':self.nlambda,
@@ -338,11 +338,14 @@ class MultiFastNetMixin(FastNetMixin): # paths with multiple responses
         lambda_values = _fit['alm'][:nfits]
 
         if ninmax > 0:
-            unsort_coefs = _fit['ca'][:(nresp*nvars*nfits)].reshape(nfits,
-                                                                    nresp,
-                                                                    nvars)
+            # C++ stores each fit as an (nx, nresp) Fortran block
+            nx = _args['nx']
+            unsort_coefs = _fit['ca'][:(nresp*nx*nfits)].reshape(nfits,
+                                                                 nresp,
+                                                                 nx)
             unsort_coefs = np.transpose(unsort_coefs, [0,2,1])
-            df = ((unsort_coefs**2).sum(2) > 0).sum(1)
+            sq_norm = np.einsum('ijk,ijk->ij', unsort_coefs, unsort_coefs)
+            df = (sq_norm > 0).sum(1)
 
             # this is order variables appear in the path
             # reorder to set original coords
@@ -376,7 +379,9 @@ class MultiFastNetMixin(FastNetMixin): # paths with multiple responses
 
         (nobs, nvars), nr = design.X.shape, response.shape[1]
         _args['a0'] = np.asfortranarray(np.zeros((nr, self.nlambda), float))
-        _args['ca'] = np.zeros((self.nlambda * nr * nvars, 1))
-        _args['y'] = np.asfortranarray(_args['y'].reshape((nobs, nr)))
+        _args['ca'] = np.zeros((self.nlambda * nr * _args['nx'], 1))
+        # a no-op when subclasses have already
+        # built `y` in Fortran order
+        _args['y'] = np.asfortranarray(_args['y'].reshape((nobs, nr)), float)
 
         return _args
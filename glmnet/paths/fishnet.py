@@ -52,6 +52,8 @@ class FishNet(FastNetMixin):
                                       offset,
                                       exclude=exclude)
 
-        _args['g'] = np.asfortranarray(offset.reshape((-1,1)).copy())
+        # copy as C++ may modify offset in place -- an (n,1)
+        # column is already Fortran contiguous
+        _args['g'] = np.array(offset, float).reshape((-1,1))
         return _args
 
@@ -46,13 +46,22 @@ class GaussNet(FastNetMixin):
             response = response - offset # makes a copy, does not modify y
             is_offset = True
 
-        # compute nulldeviance
+        # test constancy directly -- a rounded variance
+        # need not be exactly 0 for a constant response
 
         y = response # shorthand
-        ybar = (y * sample_weight).sum() / sample_weight.sum()
-        nulldev = ((y - ybar)**2 * sample_weight).sum() / sample_weight.sum()
+        if self.weight_id is None:
+            # `_check` sets sample_weight to all ones
+            # so there is nothing to mask
+            y_obs = y
+        else:
+            # only observations that carry weight count
+            positive = sample_weight > 0
+            if not np.any(positive):
+                raise ValueError("all sample weights are zero")
+            y_obs = y[positive]
 
-        if nulldev == 0:
+        if np.ptp(y_obs) == 0:
             raise ValueError("response is constant; GaussNet fails at standardization step")
 
         _args = super()._wrapper_args(design,
@@ -88,7 +88,7 @@ class LogNet(FastNetMixin):
         # fix intercept and coefs
 
         _args['a0'] = np.asfortranarray(np.zeros((nc, self.nlambda), float))
-        _args['ca'] = np.zeros((nvars*self.nlambda*nc, 1))
+        _args['ca'] = np.zeros((_args['nx']*self.nlambda*nc, 1))
 
         # reshape y
         encoder = OneHotEncoder(sparse_output=False)
@@ -64,10 +64,12 @@ class MultiGaussNet(MultiFastNetMixin):
             is_offset = False
             # be sure to copy just in case C++ modifies in place
             # (it does sometimes modify offset)
-            response = np.asfortranarray(response.copy())            
+            response = response.copy(order='F')
         else:
             offset = np.asarray(offset).astype(float)
-            response = response - offset # make a copy, do not modify 
+            # make a copy, do not modify -- Fortran order
+            # so it is passed on without a further copy
+            response = np.subtract(response, offset, order='F')
             is_offset = True
 
         _args = super()._wrapper_args(design,
@@ -0,0 +1,204 @@
+import pytest
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import KFold
+import statsmodels.api as sm
+
+from glmnet import (GaussNet,
+                    LogNet,
+                    MultiGaussNet,
+                    MultiClassNet)
+from glmnet.cox import (CoxLM,
+                        CoxNet,
+                        CoxFamily,
+                        CoxFamilySpec,
+                        CoxScorer)
+
+rng = np.random.default_rng(0)
+
+@pytest.mark.parametrize('weight_id', [None, 'weight'])
+@pytest.mark.parametrize('value', [0.1, 1/3, 7.])
+def test_constant_response(weight_id,
+                           value,
+                           n=100,
+                           p=5):
+
+    X = rng.standard_normal((n, p))
+    D = pd.DataFrame({'Y':np.full(n, value),
+                      'weight':rng.uniform(0.5, 2, size=n)})
+
+    G = GaussNet(response_id='Y',
+                 weight_id=weight_id)
+    with pytest.raises(ValueError, match='response is constant'):
+        G.fit(X, D)
+
+def test_zero_weights(n=100,
+                      p=5):
+
+    X = rng.standard_normal((n, p))
+    D = pd.DataFrame({'Y':rng.standard_normal(n),
+                      'weight':np.zeros(n)})
+
+    G = GaussNet(response_id='Y',
+                 weight_id='weight')
+    with pytest.raises(ValueError, match='sample weights are zero'):
+        G.fit(X, D)
+
+def _df_max_data(family, n, p):
+
+    X = rng.standard_normal((n, p))
+    eta = X[:,:3] @ rng.standard_normal((3, 2))
+    if family == 'binomial':
+        Y = (eta[:,0] + rng.standard_normal(n) > 0).astype(int)
+        return X, pd.DataFrame({'Y':Y}), 'Y'
+    elif family == 'multinomial':
+        Y = np.digitize(eta[:,0] + rng.standard_normal(n), [-1, 1])
+        return X, pd.DataFrame({'Y':Y}), 'Y'
+    Y = eta + rng.standard_normal((n, 2))
+    return X, pd.DataFrame(Y, columns=['Y1', 'Y2']), ['Y1', 'Y2']
+
+@pytest.mark.parametrize('cls, family', [(LogNet, 'binomial'),
+                                         (MultiGaussNet, 'mgaussian'),
+                                         (MultiClassNet, 'multinomial')])
+def test_df_max(cls,
+                family,
+                n=100,
+                p=60,
+                df_max=5):
+
+    # with a small df_max, nx < nvars and the C++ coefficient
+    # blocks have length nx -- the early fits should agree
+    # with the unrestricted path
+
+    X, D, response_id = _df_max_data(family, n, p)
+
+    L = cls(df_max=df_max, response_id=response_id).fit(X, D)
+    F = cls(response_id=response_id).fit(X, D)
+
+    assert L._args['nx'] < p
+    k = min(L.coefs_.shape[0], F.coefs_.shape[0])
+    assert np.allclose(L.coefs_[:k], F.coefs_[:k])
+
+def test_multigauss_integer_response(n=100,
+                                     p=10):
+
+    # integer responses are cast to float before
+    # reaching the C++ code
+
+    X = rng.standard_normal((n, p))
+    Y = rng.integers(0, 5, size=(n, 2))
+    D = pd.DataFrame(Y, columns=['Y1', 'Y2'])
+
+    I = MultiGaussNet(response_id=['Y1', 'Y2']).fit(X, D)
+    F = MultiGaussNet(response_id=['Y1', 'Y2']).fit(X, D.astype(float))
+
+    assert np.allclose(I.coefs_, F.coefs_)
+    assert np.allclose(I.intercepts_, F.intercepts_)
+
+def _strata_data(n, p=4):
+
+    X = rng.standard_normal((n, p))
+    event_data = pd.DataFrame({'event':rng.integers(1, 10, size=n).astype(float),
+                               'status':rng.choice([0, 1], size=n),
+                               'strata':rng.choice(['a', 'b', 'c'], size=n)})
+    return X, event_data
+
+tie_breaking_pyt = pytest.mark.parametrize('tie_breaking', ['efron', 'breslow'])
+
+@tie_breaking_pyt
+def test_strata(tie_breaking,
+                n=200):
+
+    _, event_data = _strata_data(n)
+    strata = np.asarray(event_data['strata'])
+    eta = rng.standard_normal(n)
+    sample_weight = rng.uniform(1, 2, size=n)
+
+    fam = CoxFamilySpec(event_data=event_data,
+                        tie_breaking=tie_breaking,
+                        strata_id='strata')
+    dev = fam.deviance(None, eta, sample_weight)
+    G = fam._result.gradient
+
+    # stratified deviance is the sum over strata
+
+    dev_sum = 0
+    G_sum = np.zeros(n)
+    for s in np.unique(strata):
+        idx = strata == s
+        fam_s = CoxFamilySpec(event_data=event_data[idx],
+                              tie_breaking=tie_breaking)
+        dev_sum += fam_s.deviance(None, eta[idx], sample_weight[idx])
+        G_sum[idx] = fam_s._result.gradient
+
+    assert np.allclose(dev, dev_sum)
+    assert np.allclose(G, G_sum)
+
+@tie_breaking_pyt
+def test_strata_coxlm(tie_breaking,
+                      n=200):
+
+    # strata_id on CoxFamily reaches the fit --
+    # compare to a stratified statsmodels fit
+
+    X, event_data = _strata_data(n)
+
+    family = CoxFamily(tie_breaking=tie_breaking,
+                       strata_id='strata')
+    C = CoxLM(family=family).fit(X, event_data)
+
+    P = sm.PHReg(event_data['event'],
+                 X,
+                 status=event_data['status'],
+                 strata=event_data['strata'],
+                 ties=tie_breaking).fit()
+
+    assert np.allclose(C.coef_, P.params, atol=1e-4)
+
+@pytest.mark.parametrize('missing', [None, np.nan])
+def test_strata_missing(missing,
+                        n=50):
+
+    _, event_data = _strata_data(n)
+    strata = event_data['strata'].astype(object)
+    strata.iloc[3] = missing
+    event_data['strata'] = strata
+
+    with pytest.raises(ValueError, match='strata'):
+        CoxFamilySpec(event_data=event_data,
+                      strata_id='strata')
+
+def test_strata_scorer(n=200):
+
+    X, event_data = _strata_data(n)
+
+    C = CoxNet(family=CoxFamily(strata_id='strata')).fit(X, event_data)
+    scorers = C._family._default_scorers()
+    assert all(s.coxfam.strata_id == 'strata' for s in scorers)
+
+    C.cross_validation_path(X,
+                            event_data,
+                            cv=KFold(3, random_state=0, shuffle=True))
+    assert np.all(np.isfinite(C.cv_scores_['Cox Deviance']))
+
+    # the split deviance is summed over strata
+
+    scorer = [s for s in scorers if type(s) == CoxScorer][0]
+    split = np.arange(n)[:n//2]
+    eta = rng.standard_normal(n)
+    sample_weight = np.ones(n)
+    score, w_sum = scorer.score_fn(split,
+                                   event_data,
+                                   eta,
+                                   sample_weight)
+
+    event_split = event_data.iloc[split]
+    strata = np.asarray(event_split['strata'])
+    dev_sum = 0
+    for s in np.unique(strata):
+        idx = strata == s
+        fam_s = CoxFamilySpec(event_data=event_split[idx])
+        dev_sum += fam_s.deviance(None, eta[split][idx], sample_weight[split][idx])
+
+    assert np.allclose(score, dev_sum / w_sum)